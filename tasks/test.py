@@ -21,8 +21,17 @@ def typecheck(ctx):
     print('🎉🦆 Type checking passed.')
 
 
+@task(aliases=['pytest'])
+def unit(ctx):
+    """Run unit tests with pytest."""
+    from usaon_benefit_tool.constants.paths import PACKAGE_DIR
+
+    print_and_run(f'cd {PROJECT_DIR} && pytest {PACKAGE_DIR}')
+    print('🎉🧪 Unit tests passed.')
+
+
 @task(
-    pre=[typecheck],
+    pre=[typecheck, unit],
     default=True,
 )
 def default(ctx):
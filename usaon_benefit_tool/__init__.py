@@ -3,7 +3,7 @@ import os
 import time
 from typing import Final
 
-from flask import Flask, render_template, session
+from flask import Flask, g, render_template, session
 from flask_bootstrap import Bootstrap5
 from flask_login import LoginManager
 from flask_sqlalchemy import SQLAlchemy
@@ -18,8 +18,8 @@ from usaon_benefit_tool._types import NodeType, RoleName
 from usaon_benefit_tool.constants import repo
 from usaon_benefit_tool.constants.sankey import DUMMY_NODE_ID
 from usaon_benefit_tool.constants.version import VERSION
-from usaon_benefit_tool.util.db.connect import db_connstr
-from usaon_benefit_tool.util.envvar import envvar_is_true
+from usaon_benefit_tool.util.db.connect import db_connstr, db_engine_options
+from usaon_benefit_tool.util.envvar import envvar_is_true, strict_loading_enabled
 from usaon_benefit_tool.util.flask_jsglue import JSGlue
 
 __version__: Final[str] = VERSION
@@ -39,13 +39,19 @@ db = SQLAlchemy(
 )
 
 
-def create_app():
-    """Create and configure the app."""
-    # TODO: enable override config to test_config
-    # https://flask.palletsprojects.com/en/2.3.x/tutorial/factory/
+def create_app(test_config: dict | None = None):
+    """Create and configure the app.
+
+    `test_config` is applied before any other configuration, and may provide
+    `SQLALCHEMY_DATABASE_URI` to bypass the usual database connection envvars.
+    https://flask.palletsprojects.com/en/2.3.x/tutorial/factory/
+    """
     _monkeypatch()
 
     app = Flask(__name__)
+    if test_config:
+        app.config.from_mapping(test_config)
+
     _setup_logging(app)
     _setup_config(app)
     _setup_proxy_support(app)
@@ -89,7 +95,9 @@ def _setup_logging(app) -> None:
 
 def _setup_config(app) -> None:
     app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'youcanneverguess')
-    app.config['SQLALCHEMY_DATABASE_URI'] = db_connstr(app)
+    if 'SQLALCHEMY_DATABASE_URI' not in app.config:
+        app.config['SQLALCHEMY_DATABASE_URI'] = db_connstr(app)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = db_engine_options(app)
     app.config['BOOTSTRAP_BOOTSWATCH_THEME'] = 'cosmo'
 
     # Set flask-login to pass redirection URL by session. This is needed because the
@@ -100,6 +108,9 @@ def _setup_config(app) -> None:
     # DEV ONLY: Disable login
     app.config['LOGIN_DISABLED'] = envvar_is_true("USAON_BENEFIT_TOOL_LOGIN_DISABLED")
 
+    # DEV ONLY: Raise on unexpected lazy loads in query-sensitive views
+    app.config['STRICT_LOADING'] = strict_loading_enabled()
+
     loguru_logger.debug("App configuration initialized.")
 
 
@@ -126,7 +137,13 @@ def _setup_login(app) -> None:
 
         from usaon_benefit_tool.util.dev import DEV_USER
 
-        flask_login_utils._get_user = lambda: User.query.get(DEV_USER.id)
+        def _get_dev_user() -> User:
+            # Like flask-login, load the user once per request
+            if '_login_user' not in g:
+                g._login_user = User.query.get(DEV_USER.id)
+            return g._login_user
+
+        flask_login_utils._get_user = _get_dev_user
 
     @app.before_request
     def before_request():
@@ -1,9 +1,15 @@
 from typing import Final
 
 from usaon_benefit_tool._types import NodeType
+from usaon_benefit_tool.constants.version import VERSION
 
 DUMMY_NODE_ID: Final = "__DUMMY__"
 
+# Bump when the structure of `sankey()` output changes. Cached Sankey data is also
+# discarded on every release, since its templates and colors may have changed.
+SANKEY_SERIES_FORMAT: Final = 1
+SANKEY_CACHE_VERSION: Final = f"{VERSION}+{SANKEY_SERIES_FORMAT}"
+
 # NOTE: Each tuple is directional: `(from_node_type, to_node_type)`
 ALLOWED_LINKS: Final[list[tuple[NodeType, NodeType]]] = [
     (NodeType.OBSERVING_SYSTEM, NodeType.DATA_PRODUCT),
@@ -0,0 +1,38 @@
+"""Custom column types for the data model."""
+from typing import Final
+
+from sqlalchemy.types import SmallInteger, TypeDecorator
+
+from usaon_benefit_tool._types import NodeType
+
+# WARNING: These codes are what's stored in the database. Never change or re-use a
+# code; only add new ones.
+NODE_TYPE_CODES: Final[dict[NodeType, int]] = {
+    NodeType.OBSERVING_SYSTEM: 0,
+    NodeType.DATA_PRODUCT: 1,
+    NodeType.APPLICATION: 2,
+    NodeType.SOCIETAL_BENEFIT_AREA: 3,
+}
+_NODE_TYPES_BY_CODE: Final[dict[int, NodeType]] = {
+    code: node_type for node_type, code in NODE_TYPE_CODES.items()
+}
+
+
+class NodeTypeCode(TypeDecorator):
+    """Store a `NodeType` as a small integer code instead of a string.
+
+    Python code still reads and writes `NodeType` members (or their string values).
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):  # noqa: ARG002
+        if value is None:
+            return None
+        return NODE_TYPE_CODES[NodeType(value)]
+
+    def process_result_value(self, value, dialect):  # noqa: ARG002
+        if value is None:
+            return None
+        return _NODE_TYPES_BY_CODE[value]
@@ -12,15 +12,17 @@ from datetime import datetime
 from typing import ClassVar
 
 from flask_login import UserMixin, current_user
-from sqlalchemy import CheckConstraint, case, select
+from sqlalchemy import CheckConstraint, case, event, null, select, update
 from sqlalchemy.ext.declarative import DeclarativeMeta
-from sqlalchemy.orm import column_property, relationship
+from sqlalchemy.orm import column_property, deferred, relationship
 from sqlalchemy.schema import Column, ForeignKey, Index, UniqueConstraint
-from sqlalchemy.types import Boolean, DateTime, Enum, Integer, String
+from sqlalchemy.types import JSON, Boolean, DateTime, Enum, Integer, String
 
 from usaon_benefit_tool import db
 from usaon_benefit_tool._types import NodeType, NodeTypeDiscriminator, RoleName
 from usaon_benefit_tool.constants.status import ASSESSMENT_STATUSES
+from usaon_benefit_tool.models.column_types import NODE_TYPE_CODES, NodeTypeCode
+from usaon_benefit_tool.util.envvar import strict_loading_enabled
 
 # Workaround for missing type stubs for flask-sqlalchemy:
 #     https://github.com/dropbox/sqlalchemy-stubs/issues/76#issuecomment-595839159
@@ -95,7 +97,7 @@ class Assessment(BaseModel):
     hypothetical = Column(Boolean, nullable=False, default=False)
 
     status_id = Column(
-        String,
+        String(32),
         ForeignKey('status.id'),
         default=next(iter(ASSESSMENT_STATUSES.keys())),
         nullable=False,
@@ -120,6 +122,15 @@ class Assessment(BaseModel):
         onupdate=datetime.now,
     )
 
+    # Memoized output of `sankey()`. Cleared whenever this assessment's nodes or links
+    # change (see `_clear_sankey_cache_of_modified_graphs`), and only valid while
+    # `sankey_cache_version` matches `SANKEY_CACHE_VERSION`.
+    sankey_cache = deferred(Column(JSON, nullable=True))
+    sankey_cache_version = Column(String(32), nullable=True)
+    # Incremented with every change to the graph, so a cache calculated from an older
+    # graph is never written over a newer one.
+    sankey_generation = Column(Integer, nullable=False, default=0)
+
     created_by = relationship(
         'User',
         back_populates='assessments',
@@ -153,7 +164,11 @@ class Node(BaseModel):
         autoincrement=True,
     )
     type = Column(
-        Enum(NodeType),
+        NodeTypeCode,
+        CheckConstraint(
+            f"type in ({', '.join(str(c) for c in NODE_TYPE_CODES.values())})",
+            name='valid_type',
+        ),
         nullable=False,
     )
     __mapper_args__: ClassVar = {
@@ -271,13 +286,11 @@ class AssessmentNode(BaseModel):
 
     __tablename__ = "assessment_node"
     __table_args__ = (
+        # NOTE: `assessment_id` leads so this also serves assessment-scoped lookups.
+        # The unique constraint is backed by an index, so we don't need another.
         UniqueConstraint('assessment_id', 'node_id'),
-        Index(
-            f'idx_{__tablename__}',
-            'assessment_id',
-            'node_id',
-            unique=True,  # TODO: Do we need this?
-        ),
+        # For looking up which assessments use a node
+        Index(f'idx_{__tablename__}_node', 'node_id'),
     )
 
     # TODO: If/when we make this a pure associative entity, do we need a surrogate ID?
@@ -361,9 +374,20 @@ class AssessmentNodeSubtypeApplication(AssessmentNode):
         ),
         nullable=False,
     )
-    performance_rating_criteria = Column(String, nullable=True)
-    performance_rating_rationale = Column(String, nullable=True)
-    performance_rating_gaps = Column(String, nullable=True)
+    # Long free-text fields are only needed by the form, so don't load them unless
+    # asked (e.g. with `undefer_group`)
+    performance_rating_criteria = deferred(
+        Column(String, nullable=True),
+        group='performance_rating_details',
+    )
+    performance_rating_rationale = deferred(
+        Column(String, nullable=True),
+        group='performance_rating_details',
+    )
+    performance_rating_gaps = deferred(
+        Column(String, nullable=True),
+        group='performance_rating_details',
+    )
 
 
 class Link(BaseModel):
@@ -371,12 +395,23 @@ class Link(BaseModel):
 
     __tablename__ = 'link'
     __table_args__ = (
-        UniqueConstraint('source_assessment_node_id', 'target_assessment_node_id'),
+        # Links are looked up by source _and_ by target node when loading an assessment
+        # graph. On PostgreSQL, include the remaining columns so those lookups can be
+        # index-only scans.
+        # NOTE: The unique index also enforces that nodes are linked at most once, so
+        # we don't need a separate unique constraint (and its index).
         Index(
-            f'idx_{__tablename__}',
+            f'idx_{__tablename__}_source',
             'source_assessment_node_id',
             'target_assessment_node_id',
-            unique=True,  # TODO: Do we need this?
+            unique=True,
+            postgresql_include=['id', 'performance_rating', 'criticality_rating'],
+        ),
+        Index(
+            f'idx_{__tablename__}_target',
+            'target_assessment_node_id',
+            'source_assessment_node_id',
+            postgresql_include=['id', 'performance_rating', 'criticality_rating'],
         ),
     )
     id = Column(
@@ -428,6 +463,11 @@ class Link(BaseModel):
 # Reference tables
 ##################
 
+# Walking down the SBA reference tree one object at a time costs a query per object;
+# in strict loading mode, require the tree to be loaded eagerly (e.g. with
+# `selectinload`).
+_SBA_TREE_LAZY = 'raise_on_sql' if strict_loading_enabled() else 'select'
+
 
 # TODO: Is this "association" or "reference"
 class Role(BaseModel):
@@ -442,7 +482,7 @@ class Role(BaseModel):
 class AssessmentStatus(BaseModel):
     __tablename__ = 'status'
     id = Column(
-        String,
+        String(32),
         primary_key=True,
     )
     description = Column(
@@ -466,6 +506,7 @@ class SocietalBenefitArea(BaseModel):
     societal_benefit_sub_areas = relationship(
         'SocietalBenefitSubArea',
         back_populates='societal_benefit_area',
+        lazy=_SBA_TREE_LAZY,
     )
 
 
@@ -488,6 +529,7 @@ class SocietalBenefitSubArea(BaseModel):
     societal_benefit_key_objectives = relationship(
         'SocietalBenefitKeyObjective',
         back_populates='societal_benefit_sub_area',
+        lazy=_SBA_TREE_LAZY,
     )
 
 
@@ -507,3 +549,44 @@ class SocietalBenefitKeyObjective(BaseModel):
         'SocietalBenefitSubArea',
         back_populates='societal_benefit_key_objectives',
     )
+
+
+########
+# Events
+########
+
+
+@event.listens_for(db.session, 'before_flush')
+def _clear_sankey_cache_of_modified_graphs(session, _flush_context, _instances) -> None:
+    """Clear `sankey_cache` of assessments whose nodes or links are changing."""
+    assessment_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, AssessmentNode):
+            assessment_ids.add(obj.assessment_id)
+        elif isinstance(obj, Link):
+            assessment_ids.update(
+                an.assessment_id
+                for an in (obj.source_assessment_node, obj.target_assessment_node)
+                if an is not None
+            )
+        elif isinstance(obj, Node) and obj not in session.new:
+            # Library nodes are displayed in every assessment that uses them
+            assessment_ids.update(an.assessment_id for an in obj.assessment_nodes)
+
+    # New assessments (and their new nodes) don't have an ID yet, nor a cache
+    assessment_ids.discard(None)  # type: ignore [arg-type]
+    if not assessment_ids:
+        return
+
+    with session.no_autoflush:
+        session.execute(
+            update(Assessment)
+            .where(Assessment.id.in_(assessment_ids))
+            .values(
+                sankey_cache=null(),
+                sankey_generation=Assessment.sankey_generation + 1,
+                # Clearing the cache must not count as an update to the assessment!
+                updated_timestamp=Assessment.updated_timestamp,
+            )
+            .execution_options(synchronize_session=False),
+        )
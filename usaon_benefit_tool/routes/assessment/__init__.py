@@ -1,10 +1,24 @@
-from flask import Blueprint, Response, flash, render_template, request, url_for
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    flash,
+    render_template,
+    request,
+    url_for,
+)
 from flask_login import login_required
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import defaultload, raiseload, selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import Select
 
 from usaon_benefit_tool import db
 from usaon_benefit_tool._types import RoleName
+from usaon_benefit_tool.constants.sankey import SANKEY_CACHE_VERSION
 from usaon_benefit_tool.forms import FORMS_BY_MODEL
-from usaon_benefit_tool.models.tables import Assessment
+from usaon_benefit_tool.models.tables import Assessment, AssessmentNode
 from usaon_benefit_tool.routes.assessment.link import assessment_link_bp
 from usaon_benefit_tool.routes.assessment.links import assessment_links_bp
 from usaon_benefit_tool.routes.assessment.node import assessment_node_bp
@@ -12,7 +26,7 @@ from usaon_benefit_tool.routes.assessment.nodes import (
     assessment_nodes_bp,
 )
 from usaon_benefit_tool.util.rbac import forbid_except_for_roles
-from usaon_benefit_tool.util.sankey import sankey
+from usaon_benefit_tool.util.sankey import HighchartsSankeySeries, sankey
 
 assessment_bp = Blueprint(
     'assessment',
@@ -26,17 +40,71 @@ assessment_bp.register_blueprint(assessment_node_bp)
 
 Form = FORMS_BY_MODEL[Assessment]
 
+# Load the whole assessment graph needed by `sankey()` up front; otherwise every node
+# and link lazy-loads its relationships one query at a time (N+1). Links don't need
+# their source/target loaded explicitly: those are all in this assessment, so they're
+# resolved from the identity map.
+_SANKEY_LOAD_OPTS = [
+    selectinload(AssessmentNode.node),
+    selectinload(AssessmentNode.input_links),
+    selectinload(AssessmentNode.output_links),
+]
+# In strict loading mode, any relationship on the graph which wasn't loaded above (or
+# can't be found in the identity map) raises instead of silently emitting a query.
+_STRICT_LOAD_OPTS = [
+    raiseload('*', sql_only=True),
+    *[
+        defaultload(rel).raiseload('*', sql_only=True)
+        for rel in (
+            AssessmentNode.node,
+            AssessmentNode.input_links,
+            AssessmentNode.output_links,
+        )
+    ],
+]
+
+
+# These statements are built once and executed with an `assessment_id` parameter, so
+# the (large) option chains aren't reconstructed and re-hashed on every request.
+_OVERVIEW_STMT = (
+    select(Assessment)
+    .where(Assessment.id == bindparam('assessment_id'))
+    .options(undefer(Assessment.sankey_cache))
+)
+_SANKEY_STMT = (
+    select(AssessmentNode)
+    .where(AssessmentNode.assessment_id == bindparam('assessment_id'))
+    .options(*_SANKEY_LOAD_OPTS)
+)
+_STRICT_SANKEY_STMT = _SANKEY_STMT.options(*_STRICT_LOAD_OPTS)
+
+
+def _sankey_stmt() -> Select:
+    """Statement for querying an assessment's graph to display its Sankey diagram."""
+    if current_app.config['STRICT_LOADING']:
+        return _STRICT_SANKEY_STMT
+
+    return _SANKEY_STMT
+
 
 @assessment_bp.route('')
 @login_required
 def get(assessment_id: str):
     """Display the assessment overview."""
-    assessment = db.get_or_404(Assessment, assessment_id)
-    return render_template(
+    assessment = db.session.execute(
+        _OVERVIEW_STMT,
+        {'assessment_id': assessment_id},
+    ).scalar_one_or_none()
+    if assessment is None:
+        abort(404)
+
+    rendered = render_template(
         'assessment/overview.html',
         assessment=assessment,
-        sankey_series=sankey(assessment),
+        sankey_series=_cached_sankey(assessment),
     )
+    db.session.commit()
+    return rendered
 
 
 @assessment_bp.route('/edit', methods=['GET'])
@@ -98,3 +166,48 @@ def user_guide(assessment_id: str):
         'assessment/user_guide.html',
         assessment=assessment,
     )
+
+
+def _cached_sankey(assessment: Assessment) -> HighchartsSankeySeries:
+    """Return the assessment's memoized Sankey data, calculating it if missing.
+
+    The caller is responsible for committing the newly-calculated cache, after it's done
+    with `assessment`; committing expires it, which would load the whole graph again.
+    """
+    if (
+        assessment.sankey_cache is not None
+        and assessment.sankey_cache_version == SANKEY_CACHE_VERSION
+    ):
+        return assessment.sankey_cache
+
+    # Load the graph in to the already-loaded assessment, without selecting the
+    # assessment again.
+    assessment_nodes = (
+        db.session.execute(
+            _sankey_stmt(),
+            {'assessment_id': assessment.id},
+        )
+        .scalars()
+        .all()
+    )
+    set_committed_value(assessment, 'assessment_nodes', assessment_nodes)
+    series = sankey(assessment)
+
+    # If the graph changed since `assessment` was loaded, `series` may already be stale;
+    # don't write it.
+    db.session.execute(
+        update(Assessment)
+        .where(
+            Assessment.id == assessment.id,
+            Assessment.sankey_generation == assessment.sankey_generation,
+        )
+        .values(
+            sankey_cache=series,
+            sankey_cache_version=SANKEY_CACHE_VERSION,
+            # Writing the cache must not count as an update to the assessment!
+            updated_timestamp=Assessment.updated_timestamp,
+        )
+        .execution_options(synchronize_session=False),
+    )
+
+    return series
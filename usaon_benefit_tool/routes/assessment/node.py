@@ -5,6 +5,7 @@ from flask import Blueprint, Response, abort, render_template, request, url_for
 from flask_login import login_required
 from flask_pydantic import validate
 from pydantic import BaseModel
+from sqlalchemy.orm import undefer_group, with_polymorphic
 
 from usaon_benefit_tool import db
 from usaon_benefit_tool._types import RoleName
@@ -54,7 +55,7 @@ def form_new_link(assessment_id: int, node_id: int, query: _QueryModel):
     LinkForm = FORMS_BY_MODEL[Link]
 
     # FIXME: I think this conditional is horrible!!!
-    permitted_types: set
+    permitted_types: frozenset
     if query.direction == "left":
         permitted_types = permitted_source_link_types(assessment_node.node.type)
         form = LinkForm(target_assessment_node=assessment_node)
@@ -147,9 +148,15 @@ def delete(assessment_id: int, node_id: int):
 
 def _query_for_assessment_node(assessment_id, node_id):
     try:
-        return AssessmentNode.query.filter_by(
-            assessment_id=assessment_id,
-            node_id=node_id,
-        ).one()
+        # Load subtype columns (e.g. application performance ratings) in the same query
+        return (
+            db.session.query(with_polymorphic(AssessmentNode, '*'))
+            .options(undefer_group('performance_rating_details'))
+            .filter_by(
+                assessment_id=assessment_id,
+                node_id=node_id,
+            )
+            .one()
+        )
     except sqlalchemy.orm.exc.NoResultFound:
         abort(404)
@@ -6,6 +6,7 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required
+from sqlalchemy.orm import defer, selectinload
 
 from usaon_benefit_tool import db
 from usaon_benefit_tool._types import RoleName
@@ -19,7 +20,14 @@ assessments_bp = Blueprint('assessments', __name__, url_prefix='/assessments')
 @assessments_bp.route('', methods=["GET"])
 @login_required
 def get():
-    qry = Assessment.query
+    # Descriptions can be large, and aren't displayed in the list. Creators and
+    # statuses are displayed on every row; load them in one query each rather than one
+    # per assessment.
+    qry = Assessment.query.options(
+        defer(Assessment.description),
+        selectinload(Assessment.created_by),
+        selectinload(Assessment.status),
+    )
 
     if current_user.role_id != RoleName.ADMIN:
         qry = qry.filter_by(private=False)
@@ -1,5 +1,7 @@
 from flask import Blueprint, Response, render_template, request, url_for
 from flask_login import login_required
+from sqlalchemy import select
+from sqlalchemy.orm import with_polymorphic
 
 from usaon_benefit_tool import db
 from usaon_benefit_tool._types import RoleName
@@ -13,11 +15,14 @@ node_bp = Blueprint(
     url_prefix='/object/<string:node_id>',
 )
 
+# Node subtype columns are displayed in the node form; load them in the same query
+AnyNode = with_polymorphic(Node, '*')
+
 
 @node_bp.route('', methods=['GET'])
 def get(node_id: str):
     """Display info about the node."""
-    node = db.get_or_404(Node, node_id)
+    node = db.one_or_404(select(AnyNode).where(AnyNode.id == node_id))
     form = FORMS_BY_MODEL[type(node)](obj=node)
     return render_template(
         'node.html',
@@ -48,7 +53,7 @@ def put(node_id: str):
     """Update the node."""
     forbid_except_for_roles([RoleName.ADMIN, RoleName.RESPONDENT])
 
-    node = db.get_or_404(Node, node_id)
+    node = db.one_or_404(select(AnyNode).where(AnyNode.id == node_id))
     form = FORMS_BY_MODEL[type(node)](request.form, obj=node)
 
     if not form.validate():
@@ -2,6 +2,7 @@ from flask import Blueprint, Response, render_template, request, url_for
 from flask_login import login_required
 from flask_pydantic import validate
 from pydantic import BaseModel
+from sqlalchemy.orm import defer, selectinload
 
 from usaon_benefit_tool import db
 from usaon_benefit_tool._types import NodeType, RoleName
@@ -17,7 +18,16 @@ nodes_bp = Blueprint('nodes', __name__, url_prefix='/objects')
 @nodes_bp.route('', methods=["GET"])
 @login_required
 def get():
-    nodes = Node.query.order_by(Node.created_timestamp).all()
+    # Descriptions can be large, and aren't displayed in the list. Creators are
+    # displayed on every row; load them in one query rather than one per node.
+    nodes = (
+        Node.query.options(
+            defer(Node.description),
+            selectinload(Node.created_by),
+        )
+        .order_by(Node.created_timestamp)
+        .all()
+    )
     return render_template(
         'nodes.html',
         nodes=nodes,
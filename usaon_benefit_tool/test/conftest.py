@@ -0,0 +1,87 @@
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import event, func, select
+
+from usaon_benefit_tool import create_app, db
+from usaon_benefit_tool.models.tables import Assessment
+from usaon_benefit_tool.util.db.setup import (
+    create_tables,
+    populate_reference_data,
+    populate_test_data,
+)
+from usaon_benefit_tool.util.dev import DEV_USER, TEST_USER
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory) -> Flask:
+    """Create an app backed by a temporary SQLite database loaded with test data.
+
+    Login is disabled, so every request is made as the dev user, and strict loading is
+    enabled, so unexpected lazy loads in query-sensitive views raise.
+    """
+    db_path = tmp_path_factory.mktemp('db') / 'usaon-benefit-tool.db'
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('USAON_BENEFIT_TOOL_LOGIN_DISABLED', 'true')
+        mp.setenv('USAON_BENEFIT_TOOL_STRICT_LOADING', 'true')
+        app = create_app(
+            {
+                'TESTING': True,
+                'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+                'WTF_CSRF_ENABLED': False,
+            },
+        )
+
+    with app.app_context():
+        create_tables(db.session)
+        populate_reference_data()
+        populate_test_data()
+
+        # These module-level users are read again outside of this session (e.g.
+        # `DEV_USER.id` on every request when login is disabled); load them while
+        # they're still bound to it.
+        db.session.refresh(DEV_USER)
+        db.session.refresh(TEST_USER)
+
+    return app
+
+
+@pytest.fixture()
+def client(app) -> FlaskClient:
+    return app.test_client()
+
+
+@pytest.fixture()
+def test_assessment_id(app) -> int:
+    """The ID of the assessment loaded with the test data."""
+    with app.app_context():
+        return db.session.execute(select(func.min(Assessment.id))).scalar_one()
+
+
+@pytest.fixture()
+def count_queries(app) -> Callable[[], AbstractContextManager[list[str]]]:
+    """Record the SQL statements executed within a block.
+
+    Usage: `with count_queries() as statements: ...`
+    """
+
+    @contextmanager
+    def _count_queries() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+
+        event.listen(engine, 'before_cursor_execute', _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', _record)
+
+    return _count_queries
@@ -0,0 +1,210 @@
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import select, update
+
+from usaon_benefit_tool import db
+from usaon_benefit_tool._types import NodeType
+from usaon_benefit_tool.constants.sankey import SANKEY_CACHE_VERSION
+from usaon_benefit_tool.models.tables import (
+    Assessment,
+    AssessmentNode,
+    Link,
+    NodeSubtypeOther,
+    User,
+)
+from usaon_benefit_tool.util.dev import TEST_USER
+
+
+def _sankey_cache_row(app, assessment_id: int):
+    with app.app_context():
+        return db.session.execute(
+            select(
+                Assessment.sankey_cache,
+                Assessment.sankey_cache_version,
+                Assessment.sankey_generation,
+                Assessment.updated_timestamp,
+            ).where(Assessment.id == assessment_id),
+        ).one()
+
+
+def _clear_sankey_caches(app) -> None:
+    with app.app_context():
+        db.session.execute(update(Assessment).values(sankey_cache=None))
+        db.session.commit()
+
+
+def _first_link(session, assessment_id: int) -> Link:
+    return session.execute(
+        select(Link)
+        .join(Link.source_assessment_node)
+        .where(AssessmentNode.assessment_id == assessment_id)
+        .order_by(Link.id)
+        .limit(1),
+    ).scalar_one()
+
+
+def _edit_first_link(app, assessment_id: int, performance_rating: int) -> int:
+    """Set the performance rating of the assessment's first link, returning its ID."""
+    with app.app_context():
+        link = _first_link(db.session, assessment_id)
+        link.performance_rating = performance_rating
+        db.session.commit()
+        return link.id
+
+
+def _link_tooltip(sankey_cache: dict, link_id: int) -> str:
+    return next(
+        link['tooltipHTML']
+        for link in sankey_cache['data']
+        if link.get('id') == link_id
+    )
+
+
+def _test_node(node_type: NodeType, name: str, created_by: User) -> NodeSubtypeOther:
+    return NodeSubtypeOther(
+        title=f"This is {name}",
+        short_name=name,
+        type=node_type,
+        created_by=created_by,
+        organization="-",
+        funder="-",
+        funding_country="-",
+        contact_information="-",
+    )
+
+
+@pytest.fixture(scope='module')
+def large_assessment_id(app) -> int:
+    """Create an assessment with many more nodes and links than the test one."""
+    with app.app_context():
+        test_user = db.session.execute(
+            select(User).where(User.email == TEST_USER.email),
+        ).scalar_one()
+        assessment = Assessment(title="Large assessment", created_by=test_user)
+        data_product = AssessmentNode(
+            assessment=assessment,
+            node=_test_node(NodeType.DATA_PRODUCT, "Big data product", test_user),
+        )
+        for i in range(10):
+            observing_system = AssessmentNode(
+                assessment=assessment,
+                node=_test_node(
+                    NodeType.OBSERVING_SYSTEM,
+                    f"Observing system #{i}",
+                    test_user,
+                ),
+            )
+            db.session.add(
+                Link(
+                    source_assessment_node=observing_system,
+                    target_assessment_node=data_product,
+                    performance_rating=i + 1,
+                    criticality_rating=1,
+                ),
+            )
+        db.session.commit()
+
+        return assessment.id
+
+
+def test_overview_query_count_does_not_depend_on_graph_size(
+    app,
+    client,
+    count_queries,
+    test_assessment_id,
+    large_assessment_id,
+):
+    query_counts = []
+    for assessment_id in (test_assessment_id, large_assessment_id):
+        _clear_sankey_caches(app)
+        with count_queries() as statements:
+            response = client.get(f'/assessment/{assessment_id}')
+
+        assert response.status_code == HTTPStatus.OK
+        query_counts.append(len(statements))
+
+    assert query_counts[0] == query_counts[1]
+
+
+def test_overview_serves_cached_sankey(app, client, count_queries, test_assessment_id):
+    _clear_sankey_caches(app)
+    with count_queries() as miss_statements:
+        miss = client.get(f'/assessment/{test_assessment_id}')
+    sankey_cache, version, _, _ = _sankey_cache_row(app, test_assessment_id)
+
+    assert sankey_cache is not None
+    assert version == SANKEY_CACHE_VERSION
+
+    with count_queries() as hit_statements:
+        hit = client.get(f'/assessment/{test_assessment_id}')
+
+    assert hit.data == miss.data
+    assert len(hit_statements) < len(miss_statements)
+    assert not any(s.startswith('UPDATE') for s in hit_statements)
+
+
+def test_sankey_cache_from_other_version_is_recalculated(
+    app,
+    client,
+    test_assessment_id,
+):
+    client.get(f'/assessment/{test_assessment_id}')
+    with app.app_context():
+        db.session.execute(
+            update(Assessment).values(sankey_cache_version='0.0.0+0'),
+        )
+        db.session.commit()
+
+    client.get(f'/assessment/{test_assessment_id}')
+
+    assert _sankey_cache_row(app, test_assessment_id)[1] == SANKEY_CACHE_VERSION
+
+
+def test_editing_link_clears_sankey_cache(app, client, test_assessment_id):
+    client.get(f'/assessment/{test_assessment_id}')
+    _, _, generation, updated_timestamp = _sankey_cache_row(app, test_assessment_id)
+
+    link_id = _edit_first_link(app, test_assessment_id, performance_rating=99)
+    sankey_cache, _, new_generation, new_updated_timestamp = _sankey_cache_row(
+        app,
+        test_assessment_id,
+    )
+
+    assert sankey_cache is None
+    assert new_generation == generation + 1
+    # Only the graph changed, not the assessment itself
+    assert new_updated_timestamp == updated_timestamp
+
+    client.get(f'/assessment/{test_assessment_id}')
+    sankey_cache = _sankey_cache_row(app, test_assessment_id)[0]
+
+    assert "<b>Performance rating:</b> 99" in _link_tooltip(sankey_cache, link_id)
+
+
+def test_sankey_cache_not_written_if_graph_changed_meanwhile(
+    app,
+    client,
+    monkeypatch,
+    test_assessment_id,
+):
+    # Routes can only be imported once the app has been created
+    import usaon_benefit_tool.routes.assessment as assessment_routes
+
+    _clear_sankey_caches(app)
+    sankey = assessment_routes.sankey
+
+    def _sankey_with_concurrent_edit(assessment):
+        series = sankey(assessment)
+        # Edit the graph from another session, after this request has read it
+        session = db.session.session_factory()
+        _first_link(session, test_assessment_id).performance_rating = 42
+        session.commit()
+        session.close()
+        return series
+
+    monkeypatch.setattr(assessment_routes, 'sankey', _sankey_with_concurrent_edit)
+    response = client.get(f'/assessment/{test_assessment_id}')
+
+    assert response.status_code == HTTPStatus.OK
+    assert _sankey_cache_row(app, test_assessment_id)[0] is None
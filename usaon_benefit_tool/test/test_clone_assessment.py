@@ -0,0 +1,72 @@
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from usaon_benefit_tool import db
+from usaon_benefit_tool.models.tables import (
+    Assessment,
+    AssessmentNode,
+    AssessmentNodeSubtypeApplication,
+    Link,
+)
+from usaon_benefit_tool.util.db.assessment import clone_assessment
+
+
+def _links(assessment_id: int) -> set[tuple]:
+    """Describe the assessment's links by library node, not by assessment node."""
+    source = aliased(AssessmentNode)
+    target = aliased(AssessmentNode)
+    return set(
+        db.session.execute(
+            select(
+                source.node_id,
+                target.node_id,
+                Link.performance_rating,
+                Link.criticality_rating,
+            )
+            .join(source, source.id == Link.source_assessment_node_id)
+            .join(target, target.id == Link.target_assessment_node_id)
+            .where(
+                source.assessment_id == assessment_id,
+                target.assessment_id == assessment_id,
+            ),
+        ).all(),
+    )
+
+
+def _applications(assessment_id: int) -> set[tuple]:
+    application = AssessmentNodeSubtypeApplication
+    return set(
+        db.session.execute(
+            select(
+                application.node_id,
+                application.performance_rating,
+                application.performance_rating_criteria,
+                application.performance_rating_rationale,
+                application.performance_rating_gaps,
+            ).where(application.assessment_id == assessment_id),
+        ).all(),
+    )
+
+
+def test_clone_assessment(app, test_assessment_id):
+    # No request context: the clone mustn't depend on a logged-in user
+    with app.app_context():
+        original = db.session.get(Assessment, test_assessment_id)
+        created_by = original.created_by
+        clone = clone_assessment(original, title="Clone", created_by=created_by)
+        db.session.commit()
+        clone_id = clone.id
+
+        clone = db.session.get(Assessment, clone_id)
+
+        assert clone_id != test_assessment_id
+        assert clone.title == "Clone"
+        assert clone.created_by == created_by
+
+        assert {an.node_id for an in clone.assessment_nodes} == {
+            an.node_id for an in original.assessment_nodes
+        }
+        assert _links(clone_id) == _links(test_assessment_id)
+        assert _links(clone_id)
+        assert _applications(clone_id) == _applications(test_assessment_id)
+        assert _applications(clone_id)
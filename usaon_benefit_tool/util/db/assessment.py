@@ -0,0 +1,113 @@
+from sqlalchemy import insert, literal, select
+from sqlalchemy.orm import aliased
+
+from usaon_benefit_tool import db
+from usaon_benefit_tool.models.tables import (
+    Assessment,
+    AssessmentNode,
+    AssessmentNodeSubtypeApplication,
+    Link,
+    User,
+)
+
+
+def clone_assessment(
+    assessment: Assessment,
+    *,
+    title: str,
+    created_by: User,
+) -> Assessment:
+    """Create a copy of `assessment`, including all of its nodes and links.
+
+    Nodes in the node library are shared, not copied. Each table is copied in one
+    `INSERT ... SELECT` statement, so the number of statements doesn't grow with the
+    size of the assessment. Copied assessment nodes are matched to the originals by
+    `node_id`, which is unique within an assessment.
+
+    The caller is responsible for committing.
+    """
+    clone = Assessment(
+        title=title,
+        description=assessment.description,
+        private=assessment.private,
+        hypothetical=assessment.hypothetical,
+        created_by=created_by,
+    )
+    db.session.add(clone)
+    db.session.flush()
+
+    # Assessment nodes:
+    db.session.execute(
+        insert(AssessmentNode).from_select(
+            ['assessment_id', 'node_id'],
+            select(literal(clone.id), AssessmentNode.node_id).where(
+                AssessmentNode.assessment_id == assessment.id,
+            ),
+        ),
+    )
+
+    # Find the copy of an original assessment node:
+    original = aliased(AssessmentNode)
+    copy = aliased(AssessmentNode)
+
+    def _join_copy(original, copy):
+        return (copy.node_id == original.node_id) & (copy.assessment_id == clone.id)
+
+    # Application subtype data:
+    application = AssessmentNodeSubtypeApplication.__table__
+    db.session.execute(
+        insert(application).from_select(
+            [
+                'assessment_node_id',
+                'performance_rating',
+                'performance_rating_criteria',
+                'performance_rating_rationale',
+                'performance_rating_gaps',
+            ],
+            select(
+                copy.id,
+                application.c.performance_rating,
+                application.c.performance_rating_criteria,
+                application.c.performance_rating_rationale,
+                application.c.performance_rating_gaps,
+            )
+            .join(original, original.id == application.c.assessment_node_id)
+            .join(copy, _join_copy(original, copy))
+            .where(original.assessment_id == assessment.id),
+        ),
+    )
+
+    # Links:
+    original_source = aliased(AssessmentNode)
+    original_target = aliased(AssessmentNode)
+    copy_source = aliased(AssessmentNode)
+    copy_target = aliased(AssessmentNode)
+    db.session.execute(
+        insert(Link).from_select(
+            [
+                'source_assessment_node_id',
+                'target_assessment_node_id',
+                'performance_rating',
+                'criticality_rating',
+            ],
+            select(
+                copy_source.id,
+                copy_target.id,
+                Link.performance_rating,
+                Link.criticality_rating,
+            )
+            .join(
+                original_source,
+                original_source.id == Link.source_assessment_node_id,
+            )
+            .join(
+                original_target,
+                original_target.id == Link.target_assessment_node_id,
+            )
+            .join(copy_source, _join_copy(original_source, copy_source))
+            .join(copy_target, _join_copy(original_target, copy_target))
+            .where(original_source.assessment_id == assessment.id),
+        ),
+    )
+
+    return clone
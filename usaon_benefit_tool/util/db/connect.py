@@ -42,3 +42,27 @@ def db_connstr(app: Flask) -> str:
 
         connstr = f'postgresql://{user}:{password}@{host}:{port}/{db_name}'
         return connstr
+
+
+def db_engine_options(app: Flask) -> dict:
+    """Produce SQLAlchemy engine options appropriate for the database.
+
+    The options are driver-specific, so none are set for SQLite.
+    """
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        return {}
+
+    return {
+        # Connections can be dropped while idle (e.g. by the DB server or network);
+        # check before use instead of failing the request, and proactively replace
+        # old connections.
+        # NOTE: The default pool size is plenty; our Gunicorn workers each handle one
+        # request (i.e. one session) at a time.
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+        # Send executemany INSERTs (e.g. when loading reference data) as few
+        # multi-row statements instead of one statement per row:
+        'executemany_mode': 'values_plus_batch',
+        'executemany_values_page_size': 1000,
+        'executemany_batch_page_size': 500,
+    }
@@ -79,13 +79,22 @@ def populate_test_data() -> None:
     logger.success('Test data loaded.')
 
 
+def _bulk_insert(session: Session, model, rows: list[dict]) -> None:
+    """Insert `rows` in to `model`'s table in one batch.
+
+    Much faster than adding ORM objects to the session one-by-one, but skips ORM
+    behaviors (e.g. Python-side defaults and relationships); only use for simple
+    tables, like reference tables.
+    """
+    session.execute(sqlalchemy.insert(model), rows)
+
+
 def _init_statuses(session: Session) -> None:
-    session.add_all(
+    _bulk_insert(
+        session,
+        AssessmentStatus,
         [
-            AssessmentStatus(
-                id=status,
-                description=description,
-            )
+            {'id': status, 'description': description}
             for status, description in ASSESSMENT_STATUSES.items()
         ],
     )
@@ -94,7 +103,7 @@ def _init_statuses(session: Session) -> None:
 
 
 def _init_roles(session: Session) -> None:
-    session.add_all([Role(id=role) for role in RoleName])
+    _bulk_insert(session, Role, [{'id': role} for role in RoleName])
 
     session.commit()
 
@@ -103,45 +112,36 @@ def _init_societal_benefit_areas(session: Session) -> None:
     """Insert Societal Benefit Areas from GEOSS framework.
 
     https://en.wikipedia.org/wiki/Global_Earth_Observation_System_of_Systems
+
+    Each level of the tree is inserted in one batch, parents first.
     """
-    # Add all areas:
-    session.add_all(
+    _bulk_insert(
+        session,
+        SocietalBenefitArea,
+        [{'id': sba_name} for sba_name in IAOA_SBA_FRAMEWORK.keys()],
+    )
+    _bulk_insert(
+        session,
+        SocietalBenefitSubArea,
         [
-            SocietalBenefitArea(
-                id=sba_name,
-            )
-            for sba_name in IAOA_SBA_FRAMEWORK.keys()
+            {'id': sub_area_name, 'societal_benefit_area_id': sba_name}
+            for sba_name, sba in IAOA_SBA_FRAMEWORK.items()
+            for sub_area_name in sba.keys()
+        ],
+    )
+    _bulk_insert(
+        session,
+        SocietalBenefitKeyObjective,
+        [
+            {
+                'id': key_objective_name,
+                'societal_benefit_subarea_id': sub_area_name,
+            }
+            for sba in IAOA_SBA_FRAMEWORK.values()
+            for sub_area_name, sub_area in sba.items()
+            for key_objective_name in sub_area
         ],
     )
-
-    # Flush guarantees that these records will be present in the transaction before we
-    # add the subsequent child records.
-    session.flush()
-
-    for sba_name, sba in IAOA_SBA_FRAMEWORK.items():
-        # Add all of `sba`'s sub-areas:
-        session.add_all(
-            [
-                SocietalBenefitSubArea(
-                    id=sub_area_name,
-                    societal_benefit_area_id=sba_name,
-                )
-                for sub_area_name in sba.keys()
-            ],
-        )
-        session.flush()
-
-        for sub_area_name, sub_area in sba.items():
-            # Add all of `sub_area`'s key objectives:
-            session.add_all(
-                [
-                    SocietalBenefitKeyObjective(
-                        id=key_objective_name,
-                        societal_benefit_subarea_id=sub_area_name,
-                    )
-                    for key_objective_name in sub_area
-                ],
-            )
 
     session.commit()
 
@@ -1,5 +1,7 @@
 import os
 
+from flask.helpers import get_debug_flag
+
 
 def envvar_is_true(envvar_name: str) -> bool:
     """Return `True` if environment variable is set with the value 'true'.
@@ -7,3 +9,12 @@ def envvar_is_true(envvar_name: str) -> bool:
     Case insensitive.
     """
     return os.environ.get(envvar_name, "false").lower() == "true"
+
+
+def strict_loading_enabled() -> bool:
+    """Return `True` if unexpected lazy-loading of relationships should raise an error.
+
+    Enabled in debug mode, or by setting `USAON_BENEFIT_TOOL_STRICT_LOADING`. Doesn't
+    depend on app config so it can be used at import time.
+    """
+    return get_debug_flag() or envvar_is_true("USAON_BENEFIT_TOOL_STRICT_LOADING")
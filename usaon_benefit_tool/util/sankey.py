@@ -8,20 +8,27 @@ from usaon_benefit_tool.constants.sankey import ALLOWED_LINKS, DUMMY_NODE_ID
 from usaon_benefit_tool.models.tables import Assessment, AssessmentNode, Node
 from usaon_benefit_tool.util.colormap import color_for_performance_rating
 
+# The permitted links are fixed at import time, so look them up once for every
+# NodeType instead of scanning `ALLOWED_LINKS` on each call.
+_PERMITTED_TARGET_LINK_TYPES: dict[NodeType, frozenset[NodeType]] = {
+    node_type: frozenset(e[1] for e in ALLOWED_LINKS if e[0] is node_type)
+    for node_type in NodeType
+}
+_PERMITTED_SOURCE_LINK_TYPES: dict[NodeType, frozenset[NodeType]] = {
+    node_type: frozenset(e[0] for e in ALLOWED_LINKS if e[1] is node_type)
+    for node_type in NodeType
+}
+
 
 # TODO: Should we have a general function which combines permitted sources and targets?
-def permitted_target_link_types(node_type: NodeType) -> set[NodeType]:
+def permitted_target_link_types(node_type: NodeType) -> frozenset[NodeType]:
     """NodeTypes which this NodeType is permitted to link _to_."""
-    return {
-        *[e[1] for e in ALLOWED_LINKS if e[0] is node_type],
-    }
+    return _PERMITTED_TARGET_LINK_TYPES[node_type]
 
 
-def permitted_source_link_types(node_type: NodeType) -> set[NodeType]:
+def permitted_source_link_types(node_type: NodeType) -> frozenset[NodeType]:
     """NodeTypes which this NodeType is permitted to link _from_."""
-    return {
-        *[e[0] for e in ALLOWED_LINKS if e[1] is node_type],
-    }
+    return _PERMITTED_SOURCE_LINK_TYPES[node_type]
 
 
 # NOTE: Can't use class syntax because of hard keyword conflict "from". I think this
@@ -105,9 +112,12 @@ def _sankey(assessment: Assessment) -> HighchartsSankeySeries:
     queries. Needs to be optimized!
     """
     assessment_nodes: list[AssessmentNode] = assessment.assessment_nodes
+    # Highcharts IDs, looked up by the links' foreign keys so we don't need to traverse
+    # relationships and re-generate IDs for every link.
+    node_ids: dict[int, str] = {an.id: _node_id(an.node) for an in assessment_nodes}
     nodes_simplified: list[HighchartsSankeySeriesNode] = [
         {
-            "id": _node_id(an.node),
+            "id": node_ids[an.id],
             "name": an.node.short_name,
             "type": an.node.type.value,
             "tooltipHTML": render_template(
@@ -130,8 +140,8 @@ def _sankey(assessment: Assessment) -> HighchartsSankeySeries:
     )
     links_simplified: list[HighchartsSankeySeriesLink] = [
         {
-            "from": _node_id(link.source_assessment_node.node),
-            "to": _node_id(link.target_assessment_node.node),
+            "from": node_ids[link.source_assessment_node_id],
+            "to": node_ids[link.target_assessment_node_id],
             "weight": link.criticality_rating,
             "color": color_for_performance_rating(link.performance_rating),
             "id": link.id,